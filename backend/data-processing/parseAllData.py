@@ -58,14 +58,14 @@ files = {
 for name, data in files.items():
     print(f"✅ {name}: {len(data)} records")
 
-# Try Excel files
+# Try Excel files (only the sheets we need, cached by workbook hash)
 try:
-    import openpyxl
+    from xlsxCache import load_source, to_rows
     print("\n📊 Attempting to load Excel files...")
-    wb1 = openpyxl.load_workbook('Data_For_Model/GDT Tables_Q424_EN.xlsx', data_only=True)
-    wb2 = openpyxl.load_workbook('Data_For_Model/GDT-Tables_Q325_EN.xlsx', data_only=True)
-    print(f"✅ Excel file 1: {len(wb1.sheetnames)} sheets")
-    print(f"✅ Excel file 2: {len(wb2.sheetnames)} sheets")
+    gold1 = to_rows(load_source('gold_balance_q424'))
+    gold2 = to_rows(load_source('gold_balance_q325'))
+    print(f"✅ Excel file 1: {len(gold1)} Gold Balance rows")
+    print(f"✅ Excel file 2: {len(gold2)} Gold Balance rows")
 except ImportError:
     print("⚠️ openpyxl not installed - skipping Excel files")
 except Exception as e:
@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date, datetime, time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+CACHE_DIR = os.path.join(ROOT, 'data', 'cache', 'xlsx')
+NEW_DATA_DIR = os.path.join(ROOT, 'data', 'new data')
+MODEL_DATA_DIR = os.path.join(ROOT, 'data', 'temp_extracted', 'Data For Model')
+
+# Bump when extraction or cell conversion changes so old cache entries are rebuilt
+CACHE_VERSION = 3
+
+# Sheets/ranges the pipeline actually uses. Rows/cols are 1-based and inclusive;
+# None means the edge of the sheet's used range (its !ref / dimension).
+# Gold tables are anchored on the title row + label column, so rows[1] is the
+# year/quarter header in every GDT edition (Q325/Q425 sheets already start at B4).
+SOURCES = {
+    'inf_vol': {
+        'path': os.path.join(NEW_DATA_DIR, 'Inflation Volatility.xlsx'),
+        'sheet': 'Sheet1',
+        'header': True,
+        'export': os.path.join(NEW_DATA_DIR, 'extracted_inf_vol.json'),
+    },
+    'real_rate': {
+        'path': os.path.join(NEW_DATA_DIR, 'US Real Policy Rate.xlsx'),
+        'sheet': 'Sheet1',
+        'header': True,
+        'export': os.path.join(NEW_DATA_DIR, 'extracted_real_rate.json'),
+    },
+    'gold_balance_q424': {
+        'path': os.path.join(MODEL_DATA_DIR, 'GDT Tables_Q424_EN.xlsx'),
+        'sheet': 'Gold Balance',
+        'min_row': 4,
+        'min_col': 2,
+    },
+    'gold_prices_q424': {
+        'path': os.path.join(MODEL_DATA_DIR, 'GDT Tables_Q424_EN.xlsx'),
+        'sheet': 'Prices',
+        'min_row': 4,
+        'min_col': 2,
+    },
+    'gold_balance_q325': {
+        'path': os.path.join(MODEL_DATA_DIR, 'GDT-Tables_Q325_EN.xlsx'),
+        'sheet': 'Gold Balance',
+    },
+    'gold_balance_q425': {
+        'path': os.path.join(NEW_DATA_DIR, 'GDT_Tables_Q425_EN.xlsx'),
+        'sheet': 'Gold Balance',
+    },
+}
+
+
+def file_hash(filepath):
+    """SHA-256 of the workbook bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9]+', '_', str(text)).strip('_') or 'x'
+
+
+def _table_id(filepath, sheet, header, min_row, max_row, min_col, max_col):
+    """What was asked for: resolved workbook path, sheet, range and header flag"""
+    return {'path': os.path.realpath(filepath), 'sheet': sheet, 'header': bool(header),
+            'range': [min_row, max_row, min_col, max_col]}
+
+
+def _unique(name, seen):
+    """De-duplicate column names the way sheet_to_json does: v, v_1, v_2, ..."""
+    candidate, n = name, 0
+    while candidate in seen:
+        n += 1
+        candidate = f"{name}_{n}"
+    seen.add(candidate)
+    return candidate
+
+
+def _cell_value(value):
+    """Make a cell JSON-safe. Dates become Excel serials, matching extracted_*.json"""
+    if isinstance(value, (datetime, date, time)):
+        from openpyxl.utils.datetime import to_excel
+        serial = to_excel(value)
+        return int(serial) if float(serial).is_integer() else serial
+    return value
+
+
+def extract_table(filepath, sheet, header=False, min_row=None, max_row=None, min_col=None, max_col=None):
+    """Stream one sheet/range out of a workbook and return it column-wise.
+
+    Missing bounds default to the sheet's used range, so like
+    XLSX.utils.sheet_to_json the table starts at the !ref origin, not A1.
+    With header=True the first row of the range names the columns as SheetJS
+    does (text kept as-is, blank cells become __EMPTY, duplicates get _1, _2, ...)
+    and blank rows are dropped; otherwise columns are keyed
+    by their letter and every row up to the last non-blank one is kept, so
+    to_rows(table)[i] is the same row as sheet_to_json(..., { header: 1 })[i].
+    """
+    import openpyxl
+    from openpyxl.utils import get_column_letter, range_boundaries
+
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet]
+        try:
+            dimension = ws.calculate_dimension()
+        except ValueError:
+            # read-only sheets without a <dimension> element
+            dimension = ws.calculate_dimension(force=True)
+        ref_min_col, ref_min_row, ref_max_col, ref_max_row = range_boundaries(dimension)
+        min_row = min_row or ref_min_row
+        min_col = min_col or ref_min_col
+        max_row = max_row or ref_max_row
+        max_col = max_col or ref_max_col
+
+        rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                            max_col=max_col, values_only=True)
+        seen = set()
+        columns = []
+        if header:
+            header_row = next(rows, ())
+            columns = [_unique(str(h) if h is not None else '__EMPTY', seen) for h in header_row]
+
+        data = {name: [] for name in columns}
+        n_rows = 0
+        last_filled = 0
+        for row in rows:
+            blank = all(v is None for v in row)
+            if header and blank:
+                continue
+            width = max(len(row), len(columns))
+            while len(columns) < width:
+                name = _unique('__EMPTY' if header else get_column_letter(min_col + len(columns)), seen)
+                columns.append(name)
+                data[name] = [None] * n_rows
+            for i, name in enumerate(columns):
+                data[name].append(_cell_value(row[i]) if i < len(row) else None)
+            n_rows += 1
+            if not blank:
+                last_filled = n_rows
+        # used ranges often run past the data (formatting only); drop that tail
+        for name in columns:
+            del data[name][last_filled:]
+    finally:
+        # read-only workbooks keep the zip handle open until closed
+        wb.close()
+
+    return {'columns': columns, 'data': data}
+
+
+def load_table(filepath, sheet, header=False, min_row=None, max_row=None, min_col=None,
+               max_col=None, cache_dir=CACHE_DIR):
+    """Return a cached columnar table, re-parsing the workbook only if its content changed"""
+    digest = file_hash(filepath)
+    table_id = _table_id(filepath, sheet, header, min_row, max_row, min_col, max_col)
+    # Fixed-width hash of the whole request, so no two keys collide or prefix each other;
+    # the slug is only there to make the cache directory readable
+    key = hashlib.sha256(json.dumps(table_id, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    prefix = f"{_slug(os.path.splitext(os.path.basename(filepath))[0])}__{key}__"
+    cache_file = os.path.join(cache_dir, f"{prefix}v{CACHE_VERSION}_{digest[:16]}.json")
+
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get('sha256') == digest and cached.get('version') == CACHE_VERSION
+                and cached.get('id') == table_id):
+            return cached['table']
+
+    table = extract_table(filepath, sheet, header=header, min_row=min_row, max_row=max_row,
+                          min_col=min_col, max_col=max_col)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Drop entries for older bytes or cache versions of the same workbook/sheet/range
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name != os.path.basename(cache_file):
+            os.remove(os.path.join(cache_dir, name))
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'id': table_id, 'sha256': digest, 'version': CACHE_VERSION, 'table': table}, f)
+    os.replace(tmp_file, cache_file)
+    return table
+
+
+def load_source(name, cache_dir=CACHE_DIR):
+    """Load one of the SOURCES entries by name"""
+    spec = SOURCES[name]
+    return load_table(spec['path'], spec['sheet'], header=spec.get('header', False),
+                      min_row=spec.get('min_row'), max_row=spec.get('max_row'),
+                      min_col=spec.get('min_col'), max_col=spec.get('max_col'),
+                      cache_dir=cache_dir)
+
+
+def to_records(table):
+    """Columnar table -> list of row dicts (the extracted_*.json layout)"""
+    columns, data = table['columns'], table['data']
+    n_rows = len(data[columns[0]]) if columns else 0
+    return [{c: data[c][i] for c in columns} for i in range(n_rows)]
+
+
+def to_rows(table):
+    """Columnar table -> list of row lists (same indexing as sheet_to_json with header: 1)"""
+    columns, data = table['columns'], table['data']
+    n_rows = len(data[columns[0]]) if columns else 0
+    return [[data[c][i] for c in columns] for i in range(n_rows)]
+
+
+if __name__ == '__main__':
+    # --dump NAME prints that table's rows as JSON (used by the tools/*.cjs helpers)
+    if sys.argv[1:2] == ['--dump']:
+        json.dump(to_rows(load_source(sys.argv[2])), sys.stdout)
+        sys.exit(0)
+
+    names = sys.argv[1:] or list(SOURCES)
+    for name in names:
+        spec = SOURCES[name]
+        if not os.path.exists(spec['path']):
+            print(f"⚠️ {name}: missing {spec['path']}")
+            continue
+        table = load_source(name)
+        n_rows = len(table['data'][table['columns'][0]]) if table['columns'] else 0
+        print(f"✅ {name}: {len(table['columns'])} columns x {n_rows} rows")
+        if spec.get('export'):
+            with open(spec['export'], 'w') as f:
+                json.dump(to_records(table), f, indent=2)
+            print(f"   → {os.path.relpath(spec['export'], ROOT)}")
@@ -0,0 +1,154 @@
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'backend', 'data-processing'))
+import xlsxCache  # noqa: E402
+
+
+def make_workbook(path, rows, sheet='Sheet1', origin_row=1, origin_col=1):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = sheet
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            ws.cell(row=origin_row + r, column=origin_col + c, value=value)
+    wb.save(path)
+
+
+def test_cache_hit_skips_openpyxl():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        cache = os.path.join(tmp, 'cache')
+        make_workbook(book, [['a', 'b'], [1, 2]])
+        first = xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('workbook was re-parsed on a cache hit')
+
+        original = xlsxCache.extract_table
+        xlsxCache.extract_table = fail
+        try:
+            assert xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache) == first
+        finally:
+            xlsxCache.extract_table = original
+
+
+def test_changed_workbook_invalidates_and_prunes():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        cache = os.path.join(tmp, 'cache')
+        make_workbook(book, [['a'], [1]])
+        xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+        make_workbook(book, [['a'], [42]])
+        table = xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+        assert table['data']['a'] == [42]
+        assert len(os.listdir(cache)) == 1
+
+
+def test_same_name_in_other_folder_keeps_own_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, 'cache')
+        books = []
+        for folder, value in (('one', 1), ('two', 2)):
+            os.makedirs(os.path.join(tmp, folder))
+            books.append(os.path.join(tmp, folder, 'book.xlsx'))
+            make_workbook(books[-1], [['a'], [value]])
+            xlsxCache.load_table(books[-1], 'Sheet1', header=True, cache_dir=cache)
+        assert len(os.listdir(cache)) == 2
+        assert xlsxCache.load_table(books[0], 'Sheet1', header=True, cache_dir=cache)['data']['a'] == [1]
+
+
+def test_cache_version_bump_rebuilds():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        cache = os.path.join(tmp, 'cache')
+        make_workbook(book, [['a'], [1]])
+        xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+        original = xlsxCache.CACHE_VERSION
+        xlsxCache.CACHE_VERSION = original + 1
+        try:
+            xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+            entries = os.listdir(cache)
+            assert len(entries) == 1 and f"_v{original + 1}_" in entries[0]
+        finally:
+            xlsxCache.CACHE_VERSION = original
+
+
+def test_similar_sheet_names_do_not_share_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        cache = os.path.join(tmp, 'cache')
+        wb = openpyxl.Workbook()
+        wb.active.title = 'Gold Balance'
+        wb.active['A1'] = 'space'
+        wb.create_sheet('Gold-Balance')['A1'] = 'dash'
+        wb.save(book)
+        assert xlsxCache.to_rows(xlsxCache.load_table(book, 'Gold Balance', cache_dir=cache)) == [['space']]
+        assert xlsxCache.to_rows(xlsxCache.load_table(book, 'Gold-Balance', cache_dir=cache)) == [['dash']]
+        assert len(os.listdir(cache)) == 2
+
+
+def test_header_and_plain_entries_coexist():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        cache = os.path.join(tmp, 'cache')
+        make_workbook(book, [['a'], [1]])
+        with_header = xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache)
+        plain = xlsxCache.load_table(book, 'Sheet1', cache_dir=cache)
+        assert len(os.listdir(cache)) == 2
+
+        def fail(*args, **kwargs):
+            raise AssertionError('workbook was re-parsed on a cache hit')
+
+        original = xlsxCache.extract_table
+        xlsxCache.extract_table = fail
+        try:
+            assert xlsxCache.load_table(book, 'Sheet1', header=True, cache_dir=cache) == with_header
+            assert xlsxCache.load_table(book, 'Sheet1', cache_dir=cache) == plain
+        finally:
+            xlsxCache.extract_table = original
+
+
+def test_headers_follow_sheetjs_naming():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        make_workbook(book, [['v', 'v', None, ' w ', None], [1, 2, 3, 4, 5], [6, 7, 8, 9, 10]])
+        table = xlsxCache.extract_table(book, 'Sheet1', header=True)
+        assert table['columns'] == ['v', 'v_1', '__EMPTY', ' w ', '__EMPTY_1']
+        assert xlsxCache.to_records(table) == [
+            {'v': 1, 'v_1': 2, '__EMPTY': 3, ' w ': 4, '__EMPTY_1': 5},
+            {'v': 6, 'v_1': 7, '__EMPTY': 8, ' w ': 9, '__EMPTY_1': 10},
+        ]
+
+
+def test_dates_become_excel_serials():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        make_workbook(book, [['observation_date'], [datetime(1990, 1, 1)], [datetime(1990, 1, 1, 12)]])
+        table = xlsxCache.extract_table(book, 'Sheet1', header=True)
+        assert table['data']['observation_date'] == [32874, 32874.5]
+
+
+def test_rows_start_at_used_range_origin():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = os.path.join(tmp, 'book.xlsx')
+        make_workbook(book, [['title', None], [None, 2010], ['series', 1.5]], origin_row=4, origin_col=2)
+        rows = xlsxCache.to_rows(xlsxCache.extract_table(book, 'Sheet1'))
+        assert rows == [['title', None], [None, 2010], ['series', 1.5]]
+
+
+if __name__ == '__main__':
+    failed = 0
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            try:
+                test()
+                print(f"✅ {name}")
+            except Exception as e:
+                print(f"❌ FAILED: {name}: {e!r}")
+                failed += 1
+    sys.exit(1 if failed else 0)
@@ -1,10 +1,11 @@
-const XLSX = require('xlsx');
-const filePath = 'c:/Users/thaku/Desktop/Work/MFP/data/temp_extracted/Data For Model/GDT-Tables_Q325_EN.xlsx';
-const workbook = XLSX.readFile(filePath);
+const path = require('path');
+const { execFileSync } = require('child_process');
 
-const name = 'Gold Balance';
-const sheet = workbook.Sheets[name];
-const rows = XLSX.utils.sheet_to_json(sheet, { header: 1 });
+// 'Gold Balance' of GDT-Tables_Q325_EN.xlsx, served from the xlsxCache.py cache
+// (same row/column indexing as XLSX.utils.sheet_to_json(sheet, { header: 1 }))
+const XLSX_CACHE = path.join(__dirname, '../backend/data-processing/xlsxCache.py');
+const PYTHON = process.env.PYTHON || 'python';
+const rows = JSON.parse(execFileSync(PYTHON, [XLSX_CACHE, '--dump', 'gold_balance_q325'], { encoding: 'utf8' }));
 
 const years = rows[1];
 const quarters = rows[2];
@@ -1,30 +1,27 @@
 import fs from 'fs';
 import path from 'path';
-import XLSX from 'xlsx';
+import { execFileSync } from 'child_process';
+import { fileURLToPath } from 'url';
 
-const ROOT = 'c:/Users/thaku/Desktop/Work/MFP';
+// XLSX parsing lives in backend/data-processing/xlsxCache.py, which only re-reads
+// a workbook when its content hash changes and rewrites the extracted_*.json files.
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
 const NEW_DATA_DIR = path.join(ROOT, 'data/new data');
+const XLSX_CACHE = path.join(ROOT, 'backend/data-processing/xlsxCache.py');
+const PYTHON = process.env.PYTHON || 'python';
 
-function parseXLSX(filename, sheetIdx = 0) {
-    console.log(`Parsing XLSX: ${filename}`);
-    const workbook = XLSX.readFile(path.join(NEW_DATA_DIR, filename));
-    console.log(`Sheets in ${filename}:`, workbook.SheetNames);
-    const sheetName = workbook.SheetNames[sheetIdx];
-    const worksheet = workbook.Sheets[sheetName];
-    const data = XLSX.utils.sheet_to_json(worksheet, { defval: null });
-    console.log(`Extracted ${data.length} rows from ${filename}`);
+execFileSync(PYTHON, [XLSX_CACHE, 'inf_vol', 'real_rate'], { stdio: 'inherit' });
+
+function readExtracted(filename) {
+    const data = JSON.parse(fs.readFileSync(path.join(NEW_DATA_DIR, filename), 'utf8'));
+    console.log(`Loaded ${data.length} rows from ${filename}`);
     return data;
 }
 
 // 1. Inflation Volatility
-const infVolData = parseXLSX('Inflation Volatility.xlsx');
+const infVolData = readExtracted('extracted_inf_vol.json');
 console.log('Inf Vol Sample:', infVolData.slice(0, 1));
 
 // 2. Real Policy Rate
-const realRateData = parseXLSX('US Real Policy Rate.xlsx');
+const realRateData = readExtracted('extracted_real_rate.json');
 console.log('Real Rate Sample:', realRateData.slice(0, 1));
-
-// Save to temp JSONs for the consolidation script
-fs.writeFileSync(path.join(NEW_DATA_DIR, 'extracted_inf_vol.json'), JSON.stringify(infVolData, null, 2));
-fs.writeFileSync(path.join(NEW_DATA_DIR, 'extracted_real_rate.json'), JSON.stringify(realRateData, null, 2));
-console.log('Extracted XLSX data to temp JSONs.');